@@ -3,12 +3,10 @@ Classes for managing module imports and availability information.
 """
 import abc
 from dataclasses import dataclass
-from importlib import import_module, metadata  # metadata in python >= 3.8
+from importlib import import_module
 from types import ModuleType
 import typing as t
 
-import click
-
 __all__ = ('Module', 'GPUModule', 'TorchModule')
 
 # The number of spaces to add for printing sub-levels of processors
@@ -42,19 +40,7 @@ class Module:
             The loaded module, if available
             None if the module could not be found
         """
-        key = self.name
-
-        if key in Module._modules:
-            return Module._modules[key]
-
-        # Try loading the module
-        try:
-            module = import_module(key)
-            Module._modules[key] = module
-        except ImportError:
-            Module._modules[key] = None
-
-        return Module._modules[key]
+        return self._import_module(self.name)
 
     def get_root_module(self) -> t.Union[ModuleType, None]:
         """Retrieve the root module of package
@@ -68,11 +54,37 @@ class Module:
         # Try to get the root module's name
         root_module_name = self.name.split('.')[0]
 
+        return self._import_module(root_module_name)
+
+    @staticmethod
+    def _import_module(key: str) -> t.Union[ModuleType, None]:
+        """Import the module with the given name, caching the result.
+
+        Failed imports are cached as well so that missing modules are not
+        searched for again on subsequent calls.
+
+        Parameters
+        ----------
+        key
+            The full name of the module to import.
+
+        Returns
+        -------
+        module
+            The loaded module, if available
+            None if the module could not be found
+        """
+        if key in Module._modules:
+            return Module._modules[key]
+
         # Try loading the module
         try:
-            return import_module(root_module_name)
+            module = import_module(key)
+            Module._modules[key] = module
         except ImportError:
-            return None
+            Module._modules[key] = None
+
+        return Module._modules[key]
 
     def get_callable(self,
                      callable_obj: t.Optional[t.Union[str, t.Callable,
@@ -135,6 +147,8 @@ class Module:
         subitems
             Additional items to print about the module as subitems.
         """
+        import click
+
         cls_name = self.__class__.__name__
         item_number = str(item_number) + '. ' if item_number else ""
         subitems = list(subitems) if subitems is not None else []
@@ -189,6 +203,8 @@ class TorchModule(GPUModule):
               space_level: int = space_level,
               item_number: t.Optional[str] = "",
               subitems: t.Optional[t.List[str]] = None) -> None:
+        import click
+
         # Setup arguments
         subitems = subitems if subitems is not None else []
 
@@ -4,7 +4,6 @@ Processor base classes
 import abc
 import typing as t
 
-import click
 from pocketchemist.utils.list import wraplist
 
 from ..modules import Module
@@ -119,12 +118,13 @@ class Processor(metaclass=ProcessorMeta):
         # Setup the list of modules to search
         modules = wraplist(modules, default=getattr(cls, 'modules', []))
 
-        # Filter the list, if needed
+        # Filter the list lazily, if needed, so that the search below stops
+        # at the first match
         if category is not None:
-            modules = [module for module in modules
-                       if module.category == category]
+            modules = (module for module in modules
+                       if module.category == category)
         if name is not None:
-            modules = [module for module in modules if module.name == name]
+            modules = (module for module in modules if module.name == name)
 
         # Search for the callable
         for module in modules:
@@ -153,6 +153,8 @@ class Processor(metaclass=ProcessorMeta):
         item_number
             An optional character to prepend the printed processing string.
         """
+        import click
+
         name = self.name if self.name is not None else self.__class__.__name__
         item_number = str(item_number) + '. ' if item_number else ""
         params = ", ".join("=".join((k, v)) for k, v in self.params.items())
@@ -22,5 +22,5 @@ def all_subclasses(cls):
     [<class 'disseminate.utils.classes.B'>, \
 <class 'disseminate.utils.classes.C'>]
     """
-    return cls.__subclasses__() + [g for s in cls.__subclasses__()
-                                   for g in all_subclasses(s)]
+    subclasses = cls.__subclasses__()
+    return subclasses + [g for s in subclasses for g in all_subclasses(s)]
@@ -96,3 +96,20 @@ def test_module_multiprocessing_pool():
                    for callable_obj in results)
         assert all(callable_obj.module == module
                    for callable_obj in results)  # each references module
+
+
+def test_module_get_root_module():
+    """Test the retrieval and caching of root modules"""
+    import os
+
+    # 1. Test a submodule
+    module = Module('calcs', 'os.path', 'join')
+    assert module.get_module() == os.path
+    assert module.get_root_module() == os
+    assert Module._modules['os'] == os
+
+    # 2. Test a missing module
+    module = Module('calcs', 'missing_root_module.submodule', 'func')
+    assert module.get_module() is None
+    assert module.get_root_module() is None
+    assert 'missing_root_module' in Module._modules